@@ -1,4 +1,5 @@
 import warnings
+from functools import lru_cache
 
 import numpy as np
 import shapely
@@ -12,37 +13,55 @@ def _total_bounds(polygons):
 
 def _flatten_polygons(polygons, error="raise"):
 
-    from shapely.geometry import MultiPolygon, Polygon
-
     if error not in ["raise", "skip"]:
         raise ValueError("'error' must be one of 'raise' and 'skip'")
 
-    polys = []
-    for p in polygons:
-        if isinstance(p, MultiPolygon):
-            polys += list(p.geoms)
-        elif isinstance(p, Polygon):
-            polys += [p]
-        else:
-            if error == "raise":
-                msg = f"Expected 'Polygon' or 'MultiPolygon', found {type(p)}"
-                raise TypeError(msg)
+    polygons = np.asarray(polygons, dtype=object)
+
+    # non-geometry elements would raise in get_type_id - mask them out first
+    invalid = ~shapely.is_geometry(polygons)
+
+    # 3: Polygon, 6: MultiPolygon
+    type_ids = shapely.get_type_id(np.where(invalid, None, polygons))
+    invalid |= (type_ids != 3) & (type_ids != 6)
+
+    if invalid.any():
+        if error == "raise":
+            p = polygons[invalid][0]
+            msg = f"Expected 'Polygon' or 'MultiPolygon', found {type(p)}"
+            raise TypeError(msg)
+        polygons = polygons[~invalid]
 
-    return polys
+    # explodes MultiPolygons into their parts in a single C call
+    return list(shapely.get_parts(polygons))
 
 
 def _maybe_to_dict(keys, values):
     """convert iterable to dict if necessary"""
 
     if not isinstance(values, dict):
-        values = {key: value for key, value in zip(keys, values)}
+        values = dict(zip(keys, values))
 
     return values
 
 
+@lru_cache(maxsize=32)
+def _create_dict_of_numbered_string_cached(numbers, string):
+
+    return {number: f"{string}{number}" for number in numbers}
+
+
 def _create_dict_of_numbered_string(numbers, string):
 
-    return {number: string + str(number) for number in numbers}
+    numbers = tuple(numbers)
+
+    # default names & abbrevs are requested over and over for the same numbers - cache
+    # them. Only integer numbers are cacheable: 0 and 0.0 are equal dict keys but
+    # format differently
+    if all(isinstance(number, int | np.integer) for number in numbers):
+        return _create_dict_of_numbered_string_cached(tuple(map(int, numbers)), string)
+
+    return {number: f"{string}{number}" for number in numbers}
 
 
 def _sanitize_names_abbrevs(numbers, values, default):
@@ -62,16 +81,15 @@ def _sanitize_names_abbrevs(numbers, values, default):
 
 def _wrapAngle360(lon):
     """wrap angle to `[0, 360[`."""
-    lon = np.array(lon)
+    lon = np.asarray(lon)
     return np.mod(lon, 360)
 
 
 def _wrapAngle180(lon):
     """wrap angle to `[-180, 180[`."""
-    lon = np.array(lon)
-    sel = (lon < -180) | (180 <= lon)
-    lon[sel] = _wrapAngle360(lon[sel] + 180) - 180
-    return lon
+    lon = np.asarray(lon)
+    # single vectorized pass; maps 180 -> -180 and keeps -180 (as before)
+    return np.mod(lon + 180.0, 360.0) - 180.0
 
 
 def _wrapAngle(lon, wrap_lon=True, is_unstructured=False):
@@ -81,10 +99,8 @@ def _wrapAngle(lon, wrap_lon=True, is_unstructured=False):
     If lon is from 0 to 360 wraps them to -180..180
     """
 
-    if np.isscalar(lon):
-        lon = [lon]
-
-    lon = np.array(lon)
+    # handles scalars and arrays alike, without copying float64 input
+    lon = np.asarray(lon, dtype=np.float64)
 
     if wrap_lon is True:
         mn, mx = np.nanmin(lon), np.nanmax(lon)
@@ -107,8 +123,9 @@ def _wrapAngle(lon, wrap_lon=True, is_unstructured=False):
 
 def _is_180(lon_min, lon_max, msg_add=""):
 
-    lon_min = np.round(lon_min, 6)
-    lon_max = np.round(lon_max, 6)
+    # scalar input - the builtin round avoids the ufunc dispatch overhead
+    lon_min = round(float(lon_min), 6)
+    lon_max = round(float(lon_max), 6)
 
     if (lon_min < 0) and (lon_max > 180):
         msg = f"lon has data that is larger than 180 and smaller than 0. {msg_add}"
@@ -150,7 +167,10 @@ def create_lon_lat_dataarray_from_bounds(
     lat_bnds = np.arange(lat_start, lat_stop, lat_step)
     lat = (lat_bnds[:-1] + lat_bnds[1:]) / 2
 
-    LON, LAT = np.meshgrid(lon, lat)
+    # broadcasted views - avoids materializing two dense 2D arrays
+    shape = (lat.size, lon.size)
+    LON = np.broadcast_to(lon, shape)
+    LAT = np.broadcast_to(lat[:, np.newaxis], shape)
 
     ds = xr.Dataset(
         coords=dict(
@@ -197,8 +217,12 @@ def _equally_spaced_on_split_lon(lon):
     d_lon = np.diff(lon)
     d_lon_not_isclose = ~np.isclose(d_lon[0], d_lon)
 
+    # the breakpoint cannot be the last point - checking this first is O(1)
+    if d_lon_not_isclose[-1]:
+        return False
+
     # there can only be one breakpoint
-    return (d_lon_not_isclose.sum() == 1) and not d_lon_not_isclose[-1]
+    return np.count_nonzero(d_lon_not_isclose) == 1
 
 
 def _find_splitpoint(lon):
@@ -208,12 +232,11 @@ def _find_splitpoint(lon):
 
     d_lon_not_isclose = ~np.isclose(d_lon[0], d_lon)
 
-    split_point = np.argwhere(d_lon_not_isclose)
-
-    if len(split_point) != 1:
+    if np.count_nonzero(d_lon_not_isclose) != 1:
         raise ValueError("more or less than one split point found")
 
-    return split_point.squeeze() + 1
+    # argmax short-circuits on the first True and avoids the argwhere allocation
+    return int(np.argmax(d_lon_not_isclose)) + 1
 
 
 def _sample_coords(coord):
@@ -227,14 +250,18 @@ def _sample_coords(coord):
 
     n_cells = coord.size
 
-    left = coord[0] - d_coord / 2 + d_coord / (n * 2)
-    right = coord[-1] + d_coord / 2 - d_coord / (n * 2)
+    step = d_coord / n
+    left = coord[0] - d_coord / 2 + step / 2
 
-    return np.linspace(left, right, n_cells * n)
+    return left + step * np.arange(n_cells * n)
 
 
-def unpackbits(numbers, num_bits):
-    "Unpacks elements of a array into a binary-valued output array."
+def unpackbits(numbers, num_bits, out=None):
+    """Unpacks elements of a array into a binary-valued output array.
+
+    Pass a bool array of shape ``numbers.shape + (num_bits,)`` as ``out`` to
+    recycle the output buffer over repeated calls.
+    """
 
     # after https://stackoverflow.com/a/51509307/3010700
 
@@ -242,12 +269,24 @@ def unpackbits(numbers, num_bits):
         raise ValueError("numpy data type needs to be int-like")
     shape = numbers.shape + (num_bits,)
 
-    numbers = numbers.reshape([-1, 1])
-    mask = 2 ** np.arange(num_bits, dtype=numbers.dtype).reshape([1, num_bits])
+    # fast path: np.unpackbits expands each byte to 8 bools in C
+    if (
+        out is None
+        and num_bits in (8, 16, 32, 64)
+        and numbers.dtype.itemsize * 8 >= num_bits
+    ):
+        u8 = numbers.astype(f"<u{num_bits // 8}", copy=False).reshape(-1).view(np.uint8)
+        return np.unpackbits(u8, bitorder="little").view(bool).reshape(shape)
 
-    # avoid casting to float64
-    out = np.empty(numbers.shape[0:1] + (num_bits,), dtype=bool)
-    return np.bitwise_and(numbers, mask, out=out, casting="unsafe").reshape(shape)
+    if out is None:
+        # avoid casting to float64
+        out = np.empty(shape, dtype=bool)
+    elif out.shape != shape or out.dtype != np.bool_:
+        raise ValueError(f"'out' must have shape {shape} and dtype bool")
+
+    mask = 2 ** np.arange(num_bits, dtype=numbers.dtype)
+
+    return np.bitwise_and(numbers[..., np.newaxis], mask, out=out, casting="unsafe")
 
 
 def flatten_3D_mask(mask_3D):
@@ -276,7 +315,10 @@ def flatten_3D_mask(mask_3D):
     if "region" not in mask_3D.coords:
         raise ValueError("``mask_3D`` must contain the dimension 'region'")
 
-    if (mask_3D.sum("region") > 1).any():
+    # number of regions per gridpoint - computed once, used twice
+    n_regions = mask_3D.sum("region")
+
+    if (n_regions > 1).any():
         warnings.warn(
             "Found overlapping regions which cannot correctly be reduced to a 2D mask",
             RuntimeWarning,
@@ -286,32 +328,28 @@ def flatten_3D_mask(mask_3D):
     mask_2D = (mask_3D * mask_3D.region).sum("region")
 
     # mask all gridpoints not belonging to any region
-    return mask_2D.where(mask_3D.any("region"))
+    return mask_2D.where(n_regions > 0)
 
 
-def _snap_polygon(polygon, to, atol, xy_col):
+def _snap(df, idx, to, atol, xy_col):
     """
 
-    idx: x or y coordinate
+    xy_col: x or y coordinate
     - 0: x-coord
     - 1: y-coord
 
     """
 
-    arr = shapely.get_coordinates(polygon)
-
-    sel = np.isclose(arr[:, xy_col], to, atol=atol)
-    arr[sel, xy_col] = to
-
-    return shapely.set_coordinates(polygon, arr)
-
-
-def _snap(df, idx, to, atol, xy_col):
+    def snap(coords):
+        sel = np.isclose(coords[:, xy_col], to, atol=atol)
+        coords[sel, xy_col] = to
+        return coords
 
-    polygons = df.loc[idx].geometry.tolist()
+    polygons = np.asarray(df.loc[idx].geometry.values, dtype=object)
 
-    polygons = [_snap_polygon(poly, to, atol, xy_col) for poly in polygons]
-    df.loc[idx, "geometry"] = polygons
+    # shapely.transform traverses all geometries in one C call and passes their
+    # coordinates to ``snap`` as a single (N, 2) block
+    df.loc[idx, "geometry"] = shapely.transform(polygons, snap)
 
     return df
 
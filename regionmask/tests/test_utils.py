@@ -26,6 +26,7 @@ from regionmask.core.utils import (
         [[1, 2], "str", {1: "str1", 2: "str2"}],
         [[1, 2], "Region", {1: "Region1", 2: "Region2"}],
         [[0, 1, 2], "r", {0: "r0", 1: "r1", 2: "r2"}],
+        [[0.0, 1.0], "r", {0.0: "r0.0", 1.0: "r1.0"}],
     ],
 )
 def test_create_dict_of_numbered_string(numbers, string, expected):
@@ -36,6 +37,17 @@ def test_create_dict_of_numbered_string(numbers, string, expected):
     assert result == expected
 
 
+def test_create_dict_of_numbered_string_int_float():
+    # int and equal float numbers hash alike but format differently - ensure they
+    # do not share a cache entry
+
+    result_int = _create_dict_of_numbered_string([0, 1], "r")
+    result_float = _create_dict_of_numbered_string([0.0, 1.0], "r")
+
+    assert result_int == {0: "r0", 1: "r1"}
+    assert result_float == {0.0: "r0.0", 1.0: "r1.0"}
+
+
 @pytest.mark.parametrize(
     "keys, values, expected",
     [
@@ -273,6 +285,33 @@ def test_unpackbits_numpy():
     np.testing.assert_equal(result, expected)
 
 
+def test_unpackbits_out():
+
+    numbers = np.array([0, 1, 3, 254, 255])
+    expected = unpackbits(numbers, 8)
+
+    out = np.empty((5, 8), dtype=bool)
+    result = unpackbits(numbers, 8, out=out)
+
+    assert result is out
+    np.testing.assert_equal(result, expected)
+
+    # the buffer can be recycled
+    result = unpackbits(numbers[::-1], 8, out=out)
+
+    assert result is out
+    np.testing.assert_equal(result, expected[::-1])
+
+
+@pytest.mark.parametrize("shape, dtype", [((5, 7), bool), ((5, 8), np.uint8)])
+def test_unpackbits_out_errors(shape, dtype):
+
+    numbers = np.array([0, 1, 3, 254, 255])
+
+    with pytest.raises(ValueError, match="'out' must have shape"):
+        unpackbits(numbers, 8, out=np.empty(shape, dtype=dtype))
+
+
 def test_unpackbits_wrong_dtype():
 
     with pytest.raises(ValueError, match="needs to be int-like"):